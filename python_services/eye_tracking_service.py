@@ -20,6 +20,15 @@ from flask import Flask, jsonify, request, Response
 from flask_cors import CORS
 import logging
 
+# Numba JIT for the per-frame landmark kernels (plain Python if unavailable)
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Configuration via environment variables (backward compatible)
 DEFAULT_TRACKING_SAVE_URL = os.environ.get(
     "TRACKING_SAVE_URL",
@@ -44,6 +53,56 @@ class NumpyEncoder(json.JSONEncoder):
             return bool(obj)
         return super(NumpyEncoder, self).default(obj)
 
+def convert_numpy_types(obj):
+    """Recursively convert NumPy types to native Python types"""
+    # Exact-type dispatch for containers; ndarray.tolist() already yields native scalars
+    converter = _NUMPY_CONVERTERS.get(type(obj))
+    if converter is not None:
+        return converter(obj)
+    # np.bool_, np.integer and np.floating all share np.generic.item()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+_NUMPY_CONVERTERS = {
+    dict: lambda obj: {k: convert_numpy_types(v) for k, v in obj.items()},
+    list: lambda obj: [convert_numpy_types(v) for v in obj],
+    np.ndarray: lambda obj: obj.tolist(),
+}
+
+@njit(cache=True, fastmath=True)
+def _eye_aspect_ratio(xs, ys, eye):
+    """Eye aspect ratio from six eye landmark indices (p1..p6)"""
+    # Vertical distances
+    a = np.sqrt((xs[eye[1]] - xs[eye[5]]) ** 2 + (ys[eye[1]] - ys[eye[5]]) ** 2)
+    b = np.sqrt((xs[eye[2]] - xs[eye[4]]) ** 2 + (ys[eye[2]] - ys[eye[4]]) ** 2)
+    # Horizontal distance
+    c = np.sqrt((xs[eye[0]] - xs[eye[3]]) ** 2 + (ys[eye[0]] - ys[eye[3]]) ** 2)
+    if c > 0:
+        return (a + b) / (np.float32(2.0) * c)
+    return np.float32(0.3)
+
+@njit(cache=True, fastmath=True)
+def _compute_eye_features(xs, ys, left_eye, right_eye, left_iris, right_iris):
+    """Fused per-frame kernel: average iris center (pixels) and average eye aspect ratio"""
+    # Accumulate in float32 to match the landmark arrays
+    left_x = np.float32(0.0)
+    left_y = np.float32(0.0)
+    for i in range(left_iris.shape[0]):
+        left_x += xs[left_iris[i]]
+        left_y += ys[left_iris[i]]
+    right_x = np.float32(0.0)
+    right_y = np.float32(0.0)
+    for i in range(right_iris.shape[0]):
+        right_x += xs[right_iris[i]]
+        right_y += ys[right_iris[i]]
+    
+    half = np.float32(0.5)
+    gaze_x = (left_x / np.float32(left_iris.shape[0]) + right_x / np.float32(right_iris.shape[0])) * half
+    gaze_y = (left_y / np.float32(left_iris.shape[0]) + right_y / np.float32(right_iris.shape[0])) * half
+    avg_ear = (_eye_aspect_ratio(xs, ys, left_eye) + _eye_aspect_ratio(xs, ys, right_eye)) * half
+    return gaze_x, gaze_y, avg_ear
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -149,15 +208,18 @@ class EyeTrackingService:
                 self.annotated_frame = None
                 self.pupils_located = False
                 self.eye_landmarks = None
+                self.eye_features = None
                 self.gaze_direction = None
                 self.blink_detected = False
                 self.last_blink_time = time.time()
                 
                 # Eye landmark indices for MediaPipe Face Mesh
-                self.LEFT_EYE = [362, 385, 387, 263, 373, 380]
-                self.RIGHT_EYE = [33, 160, 158, 133, 153, 144]
-                self.LEFT_IRIS = [474, 475, 476, 477]
-                self.RIGHT_IRIS = [469, 470, 471, 472]
+                self.LEFT_EYE = np.array([362, 385, 387, 263, 373, 380], dtype=np.int64)
+                self.RIGHT_EYE = np.array([33, 160, 158, 133, 153, 144], dtype=np.int64)
+                self.LEFT_IRIS = np.array([474, 475, 476, 477], dtype=np.int64)
+                self.RIGHT_IRIS = np.array([469, 470, 471, 472], dtype=np.int64)
+                self.max_landmark_index = int(max(self.LEFT_EYE.max(), self.RIGHT_EYE.max(),
+                                                  self.LEFT_IRIS.max(), self.RIGHT_IRIS.max()))
                 
                 logger.info("🎯 Real MediaPipe eye tracker initialized")
                 
@@ -185,12 +247,20 @@ class EyeTrackingService:
                         # Get frame dimensions
                         h, w, _ = frame.shape
                         
-                        # Extract eye landmarks
-                        self.eye_landmarks = []
-                        for landmark in face_landmarks.landmark:
-                            x = int(landmark.x * w)
-                            y = int(landmark.y * h)
-                            self.eye_landmarks.append((x, y))
+                        # Extract landmarks as SoA pixel coordinates for the JIT kernels
+                        coords = np.array(
+                            [(landmark.x, landmark.y) for landmark in face_landmarks.landmark],
+                            dtype=np.float32
+                        )
+                        self.eye_landmarks = (coords[:, 0] * np.float32(w), coords[:, 1] * np.float32(h))
+                        
+                        # Gaze point and blink ratio in a single fused pass
+                        self.eye_features = None
+                        if len(coords) > self.max_landmark_index:
+                            self.eye_features = _compute_eye_features(
+                                self.eye_landmarks[0], self.eye_landmarks[1],
+                                self.LEFT_EYE, self.RIGHT_EYE, self.LEFT_IRIS, self.RIGHT_IRIS
+                            )
                         
                         # Draw face mesh on frame
                         self.mp_drawing.draw_landmarks(
@@ -202,10 +272,11 @@ class EyeTrackingService:
                         )
                         
                         # Draw eye landmarks
+                        xs, ys = self.eye_landmarks
                         for eye_points in [self.LEFT_EYE, self.RIGHT_EYE]:
                             for point_idx in eye_points:
-                                if point_idx < len(self.eye_landmarks):
-                                    cv2.circle(self.annotated_frame, self.eye_landmarks[point_idx], 2, (0, 255, 0), -1)
+                                if point_idx < len(xs):
+                                    cv2.circle(self.annotated_frame, (int(xs[point_idx]), int(ys[point_idx])), 2, (0, 255, 0), -1)
                         
                         # Calculate gaze direction from iris position
                         self.calculate_gaze_direction()
@@ -229,6 +300,7 @@ class EyeTrackingService:
                     else:
                         self.pupils_located = False
                         self.eye_landmarks = None
+                        self.eye_features = None
                         self.gaze_direction = None
                         
                         # Add "no face detected" overlay
@@ -250,64 +322,34 @@ class EyeTrackingService:
                                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
             
             def calculate_gaze_direction(self):
-                """Calculate gaze direction from eye landmarks"""
-                if not self.eye_landmarks:
+                """Calculate gaze direction from the averaged iris centers"""
+                if self.eye_features is None:
                     return
                 
                 try:
-                    # Get left and right iris centers
-                    left_iris_center = self.get_iris_center(self.LEFT_IRIS)
-                    right_iris_center = self.get_iris_center(self.RIGHT_IRIS)
+                    avg_x, avg_y, _ = self.eye_features
                     
-                    if left_iris_center and right_iris_center:
-                        # Calculate average gaze direction
-                        avg_x = (left_iris_center[0] + right_iris_center[0]) / 2
-                        avg_y = (left_iris_center[1] + right_iris_center[1]) / 2
-                        
-                        # Normalize to 0-1 range (approximate)
-                        h, w = self.current_frame.shape[:2] if self.current_frame is not None else (480, 640)
-                        self.gaze_direction = (avg_x / w, avg_y / h)
-                        
-                        # Draw gaze point
-                        gaze_point = (int(avg_x), int(avg_y))
-                        cv2.circle(self.annotated_frame, gaze_point, 8, (0, 255, 255), -1)
-                        cv2.putText(self.annotated_frame, "GAZE", (gaze_point[0] - 20, gaze_point[1] - 15), 
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
+                    # Normalize to 0-1 range (approximate)
+                    h, w = self.current_frame.shape[:2] if self.current_frame is not None else (480, 640)
+                    self.gaze_direction = (avg_x / w, avg_y / h)
+                    
+                    # Draw gaze point
+                    gaze_point = (int(avg_x), int(avg_y))
+                    cv2.circle(self.annotated_frame, gaze_point, 8, (0, 255, 255), -1)
+                    cv2.putText(self.annotated_frame, "GAZE", (gaze_point[0] - 20, gaze_point[1] - 15), 
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
                 except Exception as e:
                     logger.debug(f"Error calculating gaze direction: {e}")
             
-            def get_iris_center(self, iris_landmarks):
-                """Get center point of iris from landmarks"""
-                if not self.eye_landmarks:
-                    return None
-                
-                try:
-                    iris_points = []
-                    for idx in iris_landmarks:
-                        if idx < len(self.eye_landmarks):
-                            iris_points.append(self.eye_landmarks[idx])
-                    
-                    if len(iris_points) >= 2:
-                        avg_x = sum(p[0] for p in iris_points) / len(iris_points)
-                        avg_y = sum(p[1] for p in iris_points) / len(iris_points)
-                        return (avg_x, avg_y)
-                except Exception:
-                    pass
-                return None
-            
             def detect_blinks(self):
                 """Detect eye blinks using eye aspect ratio"""
-                if not self.eye_landmarks:
+                if self.eye_features is None:
                     self.blink_detected = False
                     return
                 
                 try:
-                    # Calculate eye aspect ratio for both eyes
-                    left_ear = self.eye_aspect_ratio(self.LEFT_EYE)
-                    right_ear = self.eye_aspect_ratio(self.RIGHT_EYE)
-                    
-                    # Average the eye aspect ratios
-                    avg_ear = (left_ear + right_ear) / 2.0
+                    # Average of both eyes' aspect ratios
+                    avg_ear = self.eye_features[2]
                     
                     # Blink detection threshold
                     EAR_THRESHOLD = 0.25
@@ -324,39 +366,6 @@ class EyeTrackingService:
                     logger.debug(f"Error detecting blinks: {e}")
                     self.blink_detected = False
             
-            def eye_aspect_ratio(self, eye_landmarks):
-                """Calculate eye aspect ratio for blink detection"""
-                try:
-                    if len(eye_landmarks) < 6:
-                        return 0.3  # Default value
-                    
-                    # Get eye points
-                    eye_points = [self.eye_landmarks[i] for i in eye_landmarks if i < len(self.eye_landmarks)]
-                    
-                    if len(eye_points) < 6:
-                        return 0.3
-                    
-                    # Calculate distances
-                    def euclidean_distance(p1, p2):
-                        return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
-                    
-                    # Vertical distances
-                    A = euclidean_distance(eye_points[1], eye_points[5])
-                    B = euclidean_distance(eye_points[2], eye_points[4])
-                    
-                    # Horizontal distance
-                    C = euclidean_distance(eye_points[0], eye_points[3])
-                    
-                    # Calculate EAR
-                    if C > 0:
-                        ear = (A + B) / (2.0 * C)
-                        return ear
-                    else:
-                        return 0.3
-                        
-                except Exception:
-                    return 0.3
-            
             def horizontal_ratio(self):
                 """Get horizontal gaze ratio (0=left, 0.5=center, 1=right)"""
                 if self.gaze_direction:
@@ -390,7 +399,8 @@ class EyeTrackingService:
                 self.current_focus_state = True
                 
             def refresh(self, frame):
-                self.current_frame = frame
+                # Copy: callers may recycle the frame buffer after this returns
+                self.current_frame = frame.copy() if frame is not None else None
                 self.frame_count += 1
                 
                 # Simulate focus changes every 10-15 seconds
@@ -1195,12 +1205,13 @@ class EyeTrackingService:
         self.tracking_state = "stopped"
         logger.info("Eye tracking stopped")
 
-    def process_remote_frame(self, frame, user_id, module_id, section_id=None):
+    def process_remote_frame(self, frame, user_id, module_id, section_id=None, return_frame=True):
         """
         Process a browser-streamed frame instead of reading directly from a webcam.
 
         This method mirrors the logic from the local tracking loop so remote deployments
         (Railway) produce the exact same metrics and saved data as local Flask mode.
+        Pass return_frame=False to skip encoding the annotated frame (frame_data is None).
         """
         if self.auto_start_loop:
             raise RuntimeError("process_remote_frame is only available when auto_start_loop=False")
@@ -1231,7 +1242,10 @@ class EyeTrackingService:
             self.save_tracking_data()
 
         status = self.get_status()
-        
+
+        if not return_frame:
+            return status, None
+
         # Get the annotated frame as base64 (will use latest_frame stored by is_looking_at_screen)
         frame_data = self.get_current_frame_base64()
         
@@ -1240,9 +1254,40 @@ class EyeTrackingService:
             logger.warning("⚠️ No frame data available after processing")
         else:
             logger.debug(f"✅ Returning frame data (length: {len(frame_data)})")
-        
+
         return status, frame_data
-    
+
+    def process_remote_frames_batch(self, frames, user_ids, module_ids, section_ids=None,
+                                    return_frames=None, on_result=None):
+        """
+        Process several browser-streamed frames in one call, in order.
+
+        Lets callers hand over a batch in a single thread hop; each frame still goes
+        through process_remote_frame (MediaPipe FaceMesh runs one image at a time).
+        A frame that raises yields its exception instead of failing the rest of the
+        batch. on_result(index, result), if given, is called as each frame finishes.
+        Returns a list of (status, frame_data) tuples or exceptions in input order.
+        """
+        count = len(frames)
+        section_ids = section_ids if section_ids is not None else [None] * count
+        return_frames = return_frames if return_frames is not None else [True] * count
+
+        results = []
+        for index, (frame, user_id, module_id, section_id, return_frame) in enumerate(
+            zip(frames, user_ids, module_ids, section_ids, return_frames)
+        ):
+            try:
+                result = self.process_remote_frame(
+                    frame, user_id, module_id, section_id, return_frame=return_frame
+                )
+            except Exception as e:
+                logger.error(f"Error processing batched frame {index}: {e}")
+                result = e
+            if on_result is not None:
+                on_result(index, result)
+            results.append(result)
+        return results
+
     def get_current_frame_base64(self):
         """Get current frame as base64 string - prioritizing real camera feeds"""
         try:
@@ -1381,19 +1426,6 @@ def get_status():
             status['current_frame'] = frame_data
             
         # Convert NumPy types to native Python types
-        def convert_numpy_types(obj):
-            if isinstance(obj, dict):
-                return {k: convert_numpy_types(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_numpy_types(v) for v in obj]
-            elif isinstance(obj, np.bool_):
-                return bool(obj)
-            elif isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                return float(obj)
-            return obj
-        
         status = convert_numpy_types(status)
         
         return jsonify({'success': True, 'status': status})
@@ -6,24 +6,31 @@ Features: Async support, WebSocket real-time updates, OpenAPI documentation
 import os
 import time
 import json
-import base64
 import logging
 import asyncio
 import threading
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+import anyio.to_thread
 import uvicorn
 import cv2
 import numpy as np
+import orjson
+
+# SIMD-accelerated base64 when available (drop-in replacement for stdlib)
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 # Import the existing eye tracking service
 from eye_tracking_service import EyeTrackingService, NumpyEncoder
@@ -37,48 +44,89 @@ logger = logging.getLogger(__name__)
 
 # Global eye tracker instance
 eye_tracker: Optional[EyeTrackingService] = None
-frame_processing_task: Optional[asyncio.Task] = None
 websocket_broadcast_task: Optional[asyncio.Task] = None
 
+# Pending broadcast payloads buffered per WebSocket client
+SEND_QUEUE_SIZE = 8
+
+# Pre-built heartbeat message; only the timestamp is filled in per send
+_HEARTBEAT_TEMPLATE = '{"type":"heartbeat","timestamp":"%s"}'
+
+
+def dumps_text(message: dict) -> str:
+    """Serialize a WebSocket message with orjson (numpy scalars encoded natively)"""
+    return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
 
 # WebSocket Connection Manager
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.lock = asyncio.Lock()
+        # Each connection gets its own bounded send queue and sender task,
+        # keyed by socket so connect/disconnect are O(1); membership changes
+        # never span an await, so no lock is needed on the event loop
+        self.active_connections: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
+        # Most recent broadcast payload, replayed to newly connected clients
+        self.last_payload: Optional[str] = None
     
-    async def connect(self, websocket: WebSocket):
-        """Accept and register a new WebSocket connection"""
+    async def connect(self, websocket: WebSocket) -> bool:
+        """Accept and register a new WebSocket connection; True if a status was replayed"""
         await websocket.accept()
-        async with self.lock:
-            self.active_connections.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        # Replay the latest broadcast (at most 100ms old) through the queue so it
+        # can't overtake a newer broadcast or race the sender task on the socket
+        if self.last_payload:
+            queue.put_nowait(self.last_payload)
+        task = asyncio.create_task(self._sender_loop(websocket, queue))
+        self.active_connections[websocket] = (queue, task)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+        return bool(self.last_payload)
+    
+    def send(self, websocket: WebSocket, payload: str):
+        """Queue a payload for one client; its sender task is the only writer"""
+        entry = self.active_connections.get(websocket)
+        if entry is None:
+            return
+        queue = entry[0]
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(payload)
     
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        entry = self.active_connections.pop(websocket, None)
+        if entry is not None:
+            entry[1].cancel()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
     
+    async def _sender_loop(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain a client's send queue so slow sockets only delay themselves"""
+        while True:
+            payload = await queue.get()
+            try:
+                await websocket.send_text(payload)
+            except Exception as e:
+                logger.error(f"Error broadcasting to WebSocket: {e}")
+                break
+        
+        # Unregister without cancelling ourselves; the endpoint handler
+        # notices the dead socket on its next receive
+        self.active_connections.pop(websocket, None)
+    
     async def broadcast(self, message: dict):
         """Broadcast a message to all connected WebSocket clients"""
+        # Serialize once for all clients instead of send_json per connection
+        payload = dumps_text(message)
+        self.last_payload = payload
         if not self.active_connections:
             return
         
-        disconnected = []
-        async with self.lock:
-            for connection in self.active_connections:
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to WebSocket: {e}")
-                    disconnected.append(connection)
-        
-        # Remove disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        for queue, _ in list(self.active_connections.values()):
+            if queue.full():
+                # Drop the oldest pending update - only the latest status matters
+                queue.get_nowait()
+            queue.put_nowait(payload)
 
 
 # Initialize connection manager
@@ -124,26 +172,40 @@ class HealthResponse(BaseModel):
 
 class FramePayload(BaseModel):
     """Payload for browser-streamed frames"""
-    frame_id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=False)
+    
+    frame_id: Optional[str] = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: Optional[str] = None
     module_id: Optional[str] = None
     section_id: Optional[str] = None
-    timestamp: Optional[float] = Field(default_factory=lambda: time.time())
+    timestamp: Optional[float] = Field(default_factory=time.time)
     fps: Optional[float] = None
-    frame_base64: str
+    frame_base64: Optional[str] = Field(None, description="Image as a data:image/...;base64 URL")
+    frame_b64: Optional[str] = Field(None, description="Raw base64 image body (no data URL header)")
     
-    @validator("frame_base64")
-    def validate_base64(cls, value: str) -> str:
-        if not value.startswith("data:image/"):
+    @field_validator("frame_base64")
+    @classmethod
+    def validate_base64(cls, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return value
+        comma = value.find(",")
+        if comma < 0 or not value.startswith("data:image/"):
             raise ValueError("Expected data URL with mime type")
-        return value
+        # Keep only the base64 body so handlers don't have to split it again
+        return value[comma + 1:]
+    
+    @model_validator(mode="after")
+    def require_frame(self) -> "FramePayload":
+        if not self.frame_b64 and not self.frame_base64:
+            raise ValueError("frame_base64 or frame_b64 is required")
+        return self
 
 
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan - startup and shutdown"""
-    global eye_tracker, frame_processing_task, websocket_broadcast_task
+    global eye_tracker, websocket_broadcast_task
     
     # Startup
     logger.info("🚀 Starting FastAPI Eye Tracking Service...")
@@ -154,8 +216,13 @@ async def lifespan(app: FastAPI):
         eye_tracker = EyeTrackingService(auto_start_loop=False, camera_enabled=camera_enabled)
         logger.info(f"✅ Eye tracking service initialized (camera_enabled={camera_enabled})")
         
+        # Optionally resize the worker thread pool used for frame decoding/processing
+        thread_limit = os.environ.get("FRAME_THREAD_LIMIT")
+        if thread_limit:
+            anyio.to_thread.current_default_thread_limiter().total_tokens = int(thread_limit)
+            logger.info(f"✅ Worker thread limit set to {thread_limit}")
+        
         # Start background tasks
-        frame_processing_task = asyncio.create_task(process_frames_background())
         websocket_broadcast_task = asyncio.create_task(broadcast_websocket_updates())
         logger.info("✅ Background tasks started")
         
@@ -168,20 +235,13 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("🛑 Shutting down FastAPI Eye Tracking Service...")
     try:
-        # Stop background tasks
-        if frame_processing_task:
-            frame_processing_task.cancel()
-            try:
-                await frame_processing_task
-            except asyncio.CancelledError:
-                pass
-        
+        # Stop background tasks and per-client senders, awaiting them together
+        tasks = [task for _, task in manager.active_connections.values()]
         if websocket_broadcast_task:
-            websocket_broadcast_task.cancel()
-            try:
-                await websocket_broadcast_task
-            except asyncio.CancelledError:
-                pass
+            tasks.append(websocket_broadcast_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         
         # Stop tracking and cleanup
         if eye_tracker:
@@ -202,6 +262,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -229,55 +290,30 @@ app.add_middleware(
 
 
 # Background Tasks
-async def process_frames_background():
-    """
-    Background task to monitor tracking status.
-    Note: When auto_start_loop=True, EyeTrackingService handles frame processing
-    in its own thread. This task just monitors and handles edge cases.
-    """
-    logger.info("📹 Frame processing monitor task started")
-    while True:
-        try:
-            # The EyeTrackingService handles its own frame processing when auto_start_loop=True
-            # This task just monitors the service health
-            if eye_tracker:
-                # Check if tracking is enabled but loop isn't running
-                if (hasattr(eye_tracker, 'is_tracking_enabled') and 
-                    eye_tracker.is_tracking_enabled and 
-                    not eye_tracker.is_tracking and
-                    not eye_tracker.countdown_active):
-                    # Ensure tracking loop is running
-                    if not hasattr(eye_tracker, 'tracking_thread') or not eye_tracker.tracking_thread.is_alive():
-                        logger.warning("Tracking enabled but loop not running - this should be handled by EyeTrackingService")
-            
-            await asyncio.sleep(5)  # Check every 5 seconds
-        except asyncio.CancelledError:
-            logger.info("📹 Frame processing monitor task cancelled")
-            break
-        except Exception as e:
-            logger.error(f"❌ Error in frame processing monitor: {e}")
-            await asyncio.sleep(5)
-
-
 async def broadcast_websocket_updates():
     """Background task to broadcast tracking updates via WebSocket"""
     logger.info("📡 WebSocket broadcast task started")
     while True:
         try:
             if eye_tracker and eye_tracker.is_tracking:
+                # One clock read per tick, shared by the timestamp and countdown
+                now = time.time()
                 status = {
-                    "is_focused": bool(eye_tracker.is_focused),
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "is_focused": eye_tracker.is_focused,
+                    "is_tracking": True,
+                    "timestamp": utc_isoformat(now),
                     "session_duration": eye_tracker.get_session_duration(),
-                    "focused_time": float(eye_tracker.accumulated_focused_time),
-                    "unfocused_time": float(eye_tracker.accumulated_unfocused_time),
+                    "focused_time": eye_tracker.accumulated_focused_time,
+                    "unfocused_time": eye_tracker.accumulated_unfocused_time,
                     "tracking_state": eye_tracker.tracking_state,
                     "countdown_active": eye_tracker.countdown_active,
                     "countdown_remaining": max(0, eye_tracker.countdown_duration - 
-                                              (time.time() - eye_tracker.countdown_start_time)) 
+                                              (now - eye_tracker.countdown_start_time)) 
                                          if eye_tracker.countdown_start_time else 0
                 }
                 await manager.broadcast(status)
+            else:
+                manager.last_payload = None
             await asyncio.sleep(0.1)  # Update every 100ms
         except asyncio.CancelledError:
             logger.info("📡 WebSocket broadcast task cancelled")
@@ -287,22 +323,56 @@ async def broadcast_websocket_updates():
             await asyncio.sleep(1)
 
 
-# Helper function to convert numpy types
-def convert_numpy_types(obj):
-    """Recursively convert NumPy types to native Python types"""
-    if isinstance(obj, dict):
-        return {k: convert_numpy_types(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(v) for v in obj]
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    return obj
+# Cached "YYYY-MM-DDTHH:MM:SS" prefix for the current second
+_iso_second_cache = (None, "")
+
+
+def utc_isoformat(now: Optional[float] = None) -> str:
+    """
+    Same output as datetime.utcnow().isoformat(), but the date/time part is
+    only re-formatted once per second; per call it just appends microseconds.
+    """
+    global _iso_second_cache
+    if now is None:
+        now = time.time()
+    second = int(now)
+    micro = round((now - second) * 1e6)
+    if micro >= 1000000:
+        second += 1
+        micro = 0
+    
+    cached_second, prefix = _iso_second_cache
+    if cached_second != second:
+        prefix = datetime.utcfromtimestamp(second).isoformat()
+        _iso_second_cache = (second, prefix)
+    
+    return f"{prefix}.{micro:06d}" if micro else prefix
+
+
+def decode_and_process_frame(b64_data: str, user_id: str, module_id: str, section_id: Optional[str]):
+    """Decode a base64 image and run it through the eye tracker (runs in a worker thread)"""
+    try:
+        raw_bytes = base64.b64decode(b64_data, validate=False)
+    except Exception as e:
+        logger.error(f"Error decoding frame: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid frame data: {str(e)}")
+    
+    return process_image_bytes(raw_bytes, user_id, module_id, section_id)
+
+
+def process_image_bytes(raw_bytes: bytes, user_id: str, module_id: str, section_id: Optional[str]):
+    """Decode encoded image bytes (JPEG/PNG) and run them through the eye tracker"""
+    try:
+        np_arr = np.frombuffer(raw_bytes, dtype=np.uint8)
+        frame = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
+        
+        if frame is None:
+            raise ValueError("Failed to decode image")
+    except Exception as e:
+        logger.error(f"Error decoding frame: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid frame data: {str(e)}")
+    
+    return eye_tracker.process_remote_frame(frame, user_id, module_id, section_id)
 
 
 # API Endpoints
@@ -323,7 +393,7 @@ async def health_check():
     try:
         return HealthResponse(
             status="healthy",
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=utc_isoformat(),
             tracking=eye_tracker.is_tracking if eye_tracker else False,
             camera_enabled=eye_tracker.camera_enabled if eye_tracker else False,
             service_version="1.0.0"
@@ -423,13 +493,13 @@ async def get_tracking_status():
         
         return TrackingStatusResponse(
             is_tracking=eye_tracker.is_tracking,
-            is_focused=bool(eye_tracker.is_focused),
+            is_focused=eye_tracker.is_focused,
             user_id=eye_tracker.current_user_id,
             module_id=eye_tracker.current_module_id,
             section_id=eye_tracker.current_section_id,
             session_duration=eye_tracker.get_session_duration(),
-            focused_time=float(eye_tracker.accumulated_focused_time),
-            unfocused_time=float(eye_tracker.accumulated_unfocused_time),
+            focused_time=eye_tracker.accumulated_focused_time,
+            unfocused_time=eye_tracker.accumulated_unfocused_time,
             tracking_state=eye_tracker.tracking_state,
             countdown_active=eye_tracker.countdown_active,
             countdown_remaining=countdown_remaining
@@ -447,11 +517,12 @@ async def get_tracking_metrics():
             raise HTTPException(status_code=503, detail="Eye tracking service not initialized")
         
         metrics = eye_tracker.get_detailed_metrics()
-        return {
+        # Returned directly so orjson serializes numpy values natively
+        return ORJSONResponse({
             "success": True,
-            "metrics": convert_numpy_types(metrics),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "metrics": metrics,
+            "timestamp": utc_isoformat()
+        })
     except Exception as e:
         logger.error(f"Error getting metrics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -470,7 +541,7 @@ async def get_current_frame():
             "success": True,
             "hasFrame": frame_data is not None,
             "frameData": frame_data if frame_data else "",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_isoformat()
         }
     except Exception as e:
         logger.error(f"Error getting frame: {e}")
@@ -484,20 +555,6 @@ async def receive_browser_frame(payload: FramePayload):
         if not eye_tracker:
             raise HTTPException(status_code=503, detail="Eye tracking service not initialized")
         
-        # Decode base64 frame
-        try:
-            header, b64_data = payload.frame_base64.split(",", 1)
-            raw_bytes = base64.b64decode(b64_data)
-            np_arr = np.frombuffer(raw_bytes, dtype=np.uint8)
-            frame = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
-            
-            if frame is None:
-                raise ValueError("Failed to decode image")
-        except Exception as e:
-            logger.error(f"Error decoding frame: {e}")
-            raise HTTPException(status_code=400, detail=f"Invalid frame data: {str(e)}")
-        
-        # Process frame using eye tracker
         user_id = payload.user_id or eye_tracker.current_user_id
         module_id = payload.module_id or eye_tracker.current_module_id
         section_id = payload.section_id or eye_tracker.current_section_id
@@ -505,17 +562,17 @@ async def receive_browser_frame(payload: FramePayload):
         if not user_id or not module_id:
             raise HTTPException(status_code=400, detail="user_id and module_id are required")
         
-        # Process the frame
+        # Decode and process the frame off the event loop
         status, frame_data = await run_in_threadpool(
-            eye_tracker.process_remote_frame,
-            frame,
+            decode_and_process_frame,
+            payload.frame_b64 or payload.frame_base64,
             user_id,
             module_id,
             section_id
         )
         
-        # Convert numpy types before returning
-        return convert_numpy_types({
+        # Returned directly so orjson serializes numpy values natively
+        return ORJSONResponse({
             "success": True,
             "frame_id": payload.frame_id,
             "user_id": user_id,
@@ -533,23 +590,79 @@ async def receive_browser_frame(payload: FramePayload):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/frames_raw", tags=["Video"])
+async def receive_browser_frame_raw(
+    request: Request,
+    user_id: Optional[str] = None,
+    module_id: Optional[str] = None,
+    section_id: Optional[str] = None,
+    frame_id: Optional[str] = None
+):
+    """
+    Receive a raw encoded frame (e.g. Content-Type: image/jpeg) and process it.
+    Skips base64 on both ends - browsers post the canvas blob directly:
+    canvas.toBlob(blob => fetch('/api/frames_raw?user_id=..&module_id=..',
+                                {method: 'POST', body: blob}), 'image/jpeg')
+    """
+    try:
+        if not eye_tracker:
+            raise HTTPException(status_code=503, detail="Eye tracking service not initialized")
+        
+        user_id = user_id or eye_tracker.current_user_id
+        module_id = module_id or eye_tracker.current_module_id
+        section_id = section_id or eye_tracker.current_section_id
+        
+        if not user_id or not module_id:
+            raise HTTPException(status_code=400, detail="user_id and module_id are required")
+        
+        body = await request.body()
+        if not body:
+            raise HTTPException(status_code=400, detail="Empty frame body")
+        
+        status, frame_data = await run_in_threadpool(
+            process_image_bytes,
+            body,
+            user_id,
+            module_id,
+            section_id
+        )
+        
+        return ORJSONResponse({
+            "success": True,
+            "frame_id": frame_id or uuid.uuid4().hex,
+            "user_id": user_id,
+            "module_id": module_id,
+            "section_id": section_id,
+            "timestamp": time.time(),
+            "status": status,
+            "metrics": status.get("metrics") if isinstance(status, dict) else None,
+            "current_frame": frame_data
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error processing raw browser frame: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.websocket("/ws/tracking")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time tracking updates"""
-    await manager.connect(websocket)
+    # connect() queues the latest broadcast, if any, so reconnect storms
+    # don't rebuild and re-encode the initial status per client
+    replayed = await manager.connect(websocket)
     try:
-        # Send initial status
-        if eye_tracker:
+        if not replayed and eye_tracker:
             initial_status = {
-                "is_focused": bool(eye_tracker.is_focused),
+                "is_focused": eye_tracker.is_focused,
                 "is_tracking": eye_tracker.is_tracking,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_isoformat(),
                 "session_duration": eye_tracker.get_session_duration(),
-                "focused_time": float(eye_tracker.accumulated_focused_time),
-                "unfocused_time": float(eye_tracker.accumulated_unfocused_time),
+                "focused_time": eye_tracker.accumulated_focused_time,
+                "unfocused_time": eye_tracker.accumulated_unfocused_time,
                 "tracking_state": eye_tracker.tracking_state
             }
-            await websocket.send_json(initial_status)
+            manager.send(websocket, dumps_text(initial_status))
         
         # Keep connection alive and handle incoming messages
         while True:
@@ -557,13 +670,10 @@ async def websocket_endpoint(websocket: WebSocket):
                 # Wait for any message from client (ping/pong or commands)
                 data = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
                 # Echo back or process command
-                await websocket.send_json({"type": "pong", "data": data})
+                manager.send(websocket, dumps_text({"type": "pong", "data": data}))
             except asyncio.TimeoutError:
                 # Send heartbeat to keep connection alive
-                await websocket.send_json({
-                    "type": "heartbeat",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+                manager.send(websocket, _HEARTBEAT_TEMPLATE % utc_isoformat())
     except WebSocketDisconnect:
         manager.disconnect(websocket)
         logger.info("WebSocket client disconnected")
@@ -603,10 +713,10 @@ async def legacy_get_status():
         if frame_data:
             status['current_frame'] = frame_data
         
-        return {
+        return ORJSONResponse({
             "success": True,
-            "status": convert_numpy_types(status)
-        }
+            "status": status
+        })
     except Exception as e:
         logger.error(f"Error in legacy status endpoint: {e}")
         return {"success": False, "error": str(e)}
@@ -616,13 +726,25 @@ if __name__ == "__main__":
     # Get port from environment or default to 8000
     PORT = int(os.environ.get("PORT", 8000))
     HOST = os.environ.get("HOST", "0.0.0.0")
+    # Each worker process gets its own EyeTrackingService, so only raise this
+    # when clients are pinned to a worker (sticky sessions)
+    WORKERS = int(os.environ.get("WORKERS", 1))
     
-    logger.info(f"🚀 Starting FastAPI Eye Tracking Service on {HOST}:{PORT}")
+    # uvloop/httptools ship with uvicorn[standard] but are unavailable on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "asyncio", "h11"
+    
+    logger.info(f"🚀 Starting FastAPI Eye Tracking Service on {HOST}:{PORT} (loop={loop}, workers={WORKERS})")
     uvicorn.run(
         "fastapi_service:app",
         host=HOST,
         port=PORT,
+        loop=loop,
+        http=http,
+        workers=WORKERS,
         reload=False,  # Set to True for development
         log_level="info"
     )
-
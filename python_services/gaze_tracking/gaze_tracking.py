@@ -59,7 +59,7 @@ class GazeTracking(object):
         Arguments:
             frame (numpy.ndarray): The frame to analyze
         """
-        self.frame = frame
+        self.frame = frame.copy()
         self._analyze()
 
     def pupil_left_coords(self):
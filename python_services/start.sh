@@ -3,5 +3,5 @@
 # This ensures Python and uvicorn are found correctly
 
 # Use python3 explicitly
-exec python3 -m uvicorn fastapi_service:app --host 0.0.0.0 --port ${PORT:-8000} --workers 1
+exec python3 -m uvicorn fastapi_service:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools --workers ${WORKERS:-1}
 
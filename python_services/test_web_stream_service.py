@@ -0,0 +1,160 @@
+"""
+Tests for the browser streaming service (run with pytest from the repo root)
+"""
+import asyncio
+import base64
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("msgspec")
+pytest.importorskip("ormsgpack")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+from fastapi import HTTPException  # noqa: E402
+
+from python_services import web_stream_service as ws  # noqa: E402
+
+
+def _data_url(raw: bytes) -> str:
+    return "data:image/jpeg;base64," + base64.b64encode(raw).decode()
+
+
+@pytest.fixture
+def small_frames(monkeypatch):
+    """Cap frames at 1 KB and skip the image decode, returning the decoded bytes."""
+
+    monkeypatch.setattr(ws.settings, "max_frame_kb", 1)
+    monkeypatch.setattr(ws, "decode_frame_bytes", lambda raw: raw)
+
+
+@pytest.mark.parametrize("size", [1022, 1023, 1024])
+def test_size_precheck_accepts_frames_at_the_limit(small_frames, size):
+    # 1022/1023/1024 bytes encode with 2, 1 and 0 padding characters.
+    assert len(ws.decode_frame(_data_url(b"\xff" * size))) == size
+
+
+@pytest.mark.parametrize("size", [1025, 1026, 1027, 4096])
+def test_size_precheck_rejects_frames_over_the_limit(small_frames, size):
+    with pytest.raises(HTTPException) as exc_info:
+        ws.decode_frame(_data_url(b"\xff" * size))
+    assert exc_info.value.status_code == 413
+
+
+def test_ws_payload_coerces_like_pydantic():
+    payload = ws._ws_frame_decoder.decode(
+        b'{"frame_base64": "data:image/jpeg;base64,AA==", "user_id": 42,'
+        b' "module_id": 7.5, "timestamp": "12.5", "return_frame": "true"}'
+    )
+    assert payload.user_id == "42"
+    assert payload.module_id == "7.5"
+    assert payload.section_id is None
+    assert payload.timestamp == 12.5
+    assert payload.return_frame is True
+
+
+def test_ws_payload_rejects_non_data_urls():
+    with pytest.raises(Exception):
+        ws._ws_frame_decoder.decode(b'{"frame_base64": "aGVsbG8="}')
+
+
+@pytest.fixture
+def one_fps(monkeypatch):
+    monkeypatch.setattr(ws.settings, "max_client_fps", 1)
+    monkeypatch.setattr(ws, "_limiters", {})
+
+
+def test_allow_frame_keys_on_user_id(one_fps):
+    assert ws.allow_frame("10.0.0.1", "alice")
+    assert not ws.allow_frame("10.0.0.1", "alice")
+    # Another user behind the same IP, and the anonymous IP bucket, are unaffected.
+    assert ws.allow_frame("10.0.0.1", "bob")
+    assert ws.allow_frame("10.0.0.1", None)
+    # The same user from another IP shares their bucket.
+    assert not ws.allow_frame("10.0.0.2", "alice")
+
+
+def test_allow_frame_falls_back_to_client_ip(one_fps):
+    assert ws.allow_frame("10.0.0.1", None)
+    assert not ws.allow_frame("10.0.0.1", "")
+    # A user_id equal to an IP does not share that IP's bucket.
+    assert ws.allow_frame("10.0.0.1", "10.0.0.1")
+
+
+class _BatchTracker:
+    """Stands in for EyeTrackingService; fails frames whose user_id starts with "bad"."""
+
+    def process_remote_frames_batch(
+        self, frames, user_ids, module_ids, section_ids=None, return_frames=None, on_result=None
+    ):
+        results = []
+        for index, user_id in enumerate(user_ids):
+            if user_id.startswith("bad"):
+                result = RuntimeError(f"tracker failed on {user_id}")
+            else:
+                result = ({"user": user_id}, None)
+            results.append(result)
+            on_result(index, result)
+        return results
+
+
+def _frame_msg(user_id: str) -> ws.FrameMsg:
+    return ws.FrameMsg(
+        frame_id=user_id,
+        user_id=user_id,
+        module_id="m",
+        section_id=None,
+        timestamp=0.0,
+        jpeg=memoryview(user_id.encode()),
+    )
+
+
+def test_batch_settles_each_frame_on_its_own(monkeypatch):
+    def fake_decode(data):
+        if bytes(data).startswith(b"undecodable"):
+            raise HTTPException(status_code=400, detail="Unable to decode frame")
+        return np.zeros((2, 2, 3), dtype=np.uint8)
+
+    monkeypatch.setattr(ws, "decode_data", fake_decode)
+    monkeypatch.setattr(ws, "browser_tracker", _BatchTracker())
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        users = ["alice", "undecodable", "bad-frame", "bob"]
+        batch = [(_frame_msg(user), loop.create_future()) for user in users]
+        await loop.run_in_executor(None, ws.decode_and_track_batch, batch, loop)
+        return await asyncio.gather(*(future for _, future in batch), return_exceptions=True)
+
+    alice, undecodable, bad, bob = asyncio.run(run())
+    assert alice == ({"user": "alice"}, None)
+    assert bob == ({"user": "bob"}, None)
+    assert isinstance(undecodable, HTTPException) and undecodable.status_code == 400
+    assert isinstance(bad, RuntimeError)
+
+
+def test_pack_metrics_uses_declared_keys():
+    packed = ws.pack_metrics(
+        {
+            "focused_time": np.float64(1.5),
+            "is_focused": np.bool_(True),
+            "frames_processed": 3,
+            "current_state": "focused",
+        }
+    )
+    assert packed.dtype == np.float32
+    assert len(packed) == len(ws.METRIC_KEYS)
+    values = dict(zip(ws.METRIC_KEYS, packed.tolist()))
+    assert values["focused_time"] == 1.5
+    assert values["is_focused"] == 1.0
+    assert values["frames_processed"] == 3.0
+
+
+def test_pack_metrics_sends_nan_for_missing_or_none():
+    values = dict(zip(ws.METRIC_KEYS, ws.pack_metrics({"total_time": None}).tolist()))
+    assert all(math.isnan(value) for value in values.values())
+    assert all(math.isnan(value) for value in ws.pack_metrics(None).tolist())
@@ -7,18 +7,28 @@ and summarized results are pushed to the existing PHP endpoint.
 """
 
 from __future__ import annotations
-import base64
-import json
+import asyncio
 import logging
+import multiprocessing
 import os
+import re
+import struct
+import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
-
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+import msgspec
 import numpy as np
+import orjson
+import ormsgpack
 from fastapi import (
     BackgroundTasks,
-    Depends,
     FastAPI,
     HTTPException,
     Request,
@@ -26,12 +36,42 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, BaseSettings, Field, validator
 from starlette.concurrency import run_in_threadpool
 
 from python_services.eye_tracking_service import EyeTrackingService
 
+# SIMD-accelerated base64 when available (drop-in replacement for stdlib)
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+
+    _jpeg: Optional[TurboJPEG] = TurboJPEG()
+except Exception:  # noqa: BLE001 - module or libturbojpeg shared library missing
+    _jpeg = None
+
+# Optional GPU JPEG decode (nvJPEG via nvImageCodec) on CUDA-equipped nodes.
+_nvdecoder = None
+if os.getenv("USE_NVJPEG", "").lower() in ("1", "true"):
+    try:
+        from nvidia import nvimgcodec
+
+        _nvdecoder = nvimgcodec.Decoder()
+    except Exception as exc:  # noqa: BLE001 - package or CUDA runtime missing
+        logging.getLogger("web-stream-service").warning(
+            "USE_NVJPEG set but nvImageCodec is unavailable (%s); using CPU decode", exc
+        )
+
+# Recycled BGR output buffers for TurboJPEG decodes, shared by the worker threads.
+FRAME_POOL_SIZE = 8
+_frame_pool: List[np.ndarray] = []
+_pool_lock = threading.Lock()
+
 
 class Settings(BaseSettings):
     """Runtime configuration wired to Railway environment variables."""
@@ -57,14 +97,31 @@ class Settings(BaseSettings):
         description="Comma-separated list of origins permitted to call the API.",
     )
     max_frame_kb: int = Field(
-        default=512,
+        default=64,
         env="MAX_FRAME_KB",
-        description="Reject frames larger than this many KB.",
+        description=(
+            "Reject frames larger than this many KB. Clients are expected to downscale "
+            "to <=640x480 and re-encode as JPEG (quality ~0.6) before sending, which "
+            "lands well under 64 KB; raise this only for full-resolution clients."
+        ),
     )
     max_client_fps: int = Field(
-        default=10,
+        default=15,
         env="MAX_CLIENT_FPS",
-        description="Logical FPS budget enforced per client.",
+        description="Logical FPS budget enforced per client (cheap downscaled frames allow more).",
+    )
+    tracker_processes: int = Field(
+        default=0,
+        env="TRACKER_PROCESSES",
+        description=(
+            "Run decode + tracking in this many worker processes (each with its own "
+            "EyeTrackingService) instead of the threadpool. 0 keeps the threadpool."
+        ),
+    )
+    batch_workers: int = Field(
+        default=4,
+        env="BATCH_WORKERS",
+        description="WebSocket frame batches that may be on the threadpool at once.",
     )
     model_name: str = Field(default="mediapipe-face-mesh", env="MODEL_NAME")
     browser_streaming_enabled: bool = Field(
@@ -87,17 +144,85 @@ settings = Settings()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("web-stream-service")
 
-browser_tracker = EyeTrackingService(
-    tracking_save_url=settings.tracking_save_url,
-    camera_enabled=False,
-    auto_start_loop=False,
+# Created per worker process at startup (MediaPipe graph and numpy buffers are
+# not shareable across processes). Rate limiter state is per worker as well.
+browser_tracker: Optional[EyeTrackingService] = None
+
+# Optional tracker processes (TRACKER_PROCESSES > 0), each a single-process
+# executor so a user's frames always reach the same EyeTrackingService. Empty
+# means frames are decoded and tracked on the threadpool of this worker.
+tracker_executors: List[ProcessPoolExecutor] = []
+
+
+def _create_tracker() -> EyeTrackingService:
+    return EyeTrackingService(
+        tracking_save_url=settings.tracking_save_url,
+        camera_enabled=False,
+        auto_start_loop=False,
+    )
+
+
+def _init_tracker_process() -> None:
+    """ProcessPoolExecutor initializer: one EyeTrackingService per child process."""
+
+    global browser_tracker
+    browser_tracker = _create_tracker()
+
+
+def _create_tracker_executor() -> ProcessPoolExecutor:
+    # spawn, not fork: the parent already runs an event loop and threads.
+    return ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_tracker_process,
+    )
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    global browser_tracker, frame_batches
+    batchers: List[asyncio.Task] = []
+    if settings.tracker_processes > 0:
+        tracker_executors[:] = [
+            _create_tracker_executor() for _ in range(settings.tracker_processes)
+        ]
+    else:
+        browser_tracker = _create_tracker()
+        frame_batches = asyncio.Queue()
+        batchers = [
+            asyncio.create_task(run_frame_batches())
+            for _ in range(max(1, settings.batch_workers))
+        ]
+    yield
+    for batcher in batchers:
+        batcher.cancel()
+    frame_batches = None
+    for executor in tracker_executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+    tracker_executors.clear()
+
+
+app = FastAPI(
+    title=settings.app_name,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-app = FastAPI(title=settings.app_name)
+# Origins are deduplicated once at startup. Entries with a "*" wildcard (e.g.
+# https://*.up.railway.app) are folded into a single allow_origin_regex.
+_origins = {origin for origin in settings.allowed_origins.split(",") if origin}
+_wildcard_origins = sorted(o for o in _origins if o != "*" and "*" in o)
+ALLOWED_ORIGINS = tuple(sorted(_origins.difference(_wildcard_origins)))
+ALLOWED_ORIGIN_REGEX = (
+    "^(?:%s)$" % "|".join(re.escape(o).replace(r"\*", "[^/]+") for o in _wildcard_origins)
+    if _wildcard_origins
+    else None
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins.split(","),
+    allow_origins=list(ALLOWED_ORIGINS),
+    allow_origin_regex=ALLOWED_ORIGIN_REGEX,
     allow_methods=["POST", "OPTIONS"],
     allow_headers=["*"],
     allow_credentials=False,
@@ -114,6 +239,10 @@ class FramePayload(BaseModel):
     timestamp: float = Field(default_factory=lambda: time.time())
     fps: Optional[float] = None
     frame_base64: str
+    return_frame: bool = Field(
+        default=False,
+        description="Include the annotated frame (base64 JPEG) as current_frame in the response.",
+    )
 
     @validator("frame_base64")
     def validate_base64(cls, value: str) -> str:
@@ -122,15 +251,87 @@ class FramePayload(BaseModel):
         return value
 
 
-def decode_frame(data_url: str) -> np.ndarray:
-    """Convert a browser data URL (base64-encoded) into a numpy array image."""
+class WSFramePayload(msgspec.Struct):
+    """``FramePayload`` for WebSocket text frames, decoded by msgspec's compiled decoder.
 
-    header, b64_data = data_url.split(",", 1)
-    raw_bytes = base64.b64decode(b64_data)
+    The HTTP endpoints stay on pydantic for the OpenAPI schema. Decoding is lax
+    (numeric strings for ``timestamp``/``fps``/``return_frame``) and numeric ids
+    become strings, matching pydantic v1's coercion.
+    """
+
+    frame_base64: str
+    frame_id: Union[str, int, float] = msgspec.field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: Union[str, int, float, None] = None
+    module_id: Union[str, int, float, None] = None
+    section_id: Union[str, int, float, None] = None
+    timestamp: float = msgspec.field(default_factory=time.time)
+    fps: Optional[float] = None
+    return_frame: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.frame_base64.startswith("data:image/"):
+            raise ValueError("Expected data URL with mime type")
+        for name in ("frame_id", "user_id", "module_id", "section_id"):
+            value = getattr(self, name)
+            if isinstance(value, (int, float)):
+                setattr(self, name, str(value))
+
+
+_ws_frame_decoder = msgspec.json.Decoder(WSFramePayload, strict=False)
+
+
+def acquire_frame(height: int, width: int) -> np.ndarray:
+    """Pop a pooled BGR buffer of this shape, allocating only on a miss."""
+
+    shape = (height, width, 3)
+    with _pool_lock:
+        for index in range(len(_frame_pool) - 1, -1, -1):
+            if _frame_pool[index].shape == shape:
+                return _frame_pool.pop(index)
+    return np.empty(shape, dtype=np.uint8)
 
-    max_bytes = settings.max_frame_kb * 1024
-    if len(raw_bytes) > max_bytes:
-        raise HTTPException(status_code=413, detail="Frame exceeds size limit")
+
+def release_frame(frame: np.ndarray) -> None:
+    """Return a decoded frame to the pool once nothing references it any more."""
+
+    if frame.dtype != np.uint8 or frame.ndim != 3 or not frame.flags.c_contiguous:
+        return
+    if not frame.flags.writeable or frame.base is not None:
+        return
+    with _pool_lock:
+        if len(_frame_pool) < FRAME_POOL_SIZE:
+            _frame_pool.append(frame)
+
+
+def decode_image(raw_bytes: bytes) -> np.ndarray:
+    """Decode JPEG bytes with nvJPEG (if enabled) or libjpeg-turbo, falling back to OpenCV.
+
+    The TurboJPEG path decodes into a buffer from ``acquire_frame``; callers hand
+    it back with ``release_frame`` once they are done with the image.
+    """
+
+    if _nvdecoder is not None:
+        try:
+            import cv2
+
+            # nvImageCodec decodes to RGB on the device; bring it back as BGR.
+            rgb = np.asarray(_nvdecoder.decode(np.frombuffer(raw_bytes, dtype=np.uint8)).cpu())
+            return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+        except Exception:  # noqa: BLE001 - fall through to the CPU decoders
+            pass
+
+    if _jpeg is not None:
+        try:
+            width, height, _, _ = _jpeg.decode_header(raw_bytes)
+            buffer = acquire_frame(height, width)
+        except Exception:  # noqa: BLE001 - not a JPEG (e.g. PNG); let OpenCV try
+            pass
+        else:
+            try:
+                _jpeg.decode(raw_bytes, pixel_format=TJPF_BGR, dst=buffer)
+                return buffer
+            except Exception:  # noqa: BLE001 - corrupt JPEG; let OpenCV try
+                release_frame(buffer)
 
     np_arr = np.frombuffer(raw_bytes, dtype=np.uint8)
     try:
@@ -144,8 +345,275 @@ def decode_frame(data_url: str) -> np.ndarray:
         raise HTTPException(status_code=500, detail=f"cv2 missing: {exc}") from exc
 
 
-async def process_frame(payload: FramePayload) -> Dict[str, Any]:
-    """Decode frame, run the shared eye-tracking pipeline, and format response."""
+@dataclass(frozen=True)
+class FrameMsg:
+    """Binary WebSocket frame: metadata from the packed header plus the JPEG body.
+
+    Built directly from ``FRAME_HEADER`` fields, skipping pydantic validation on
+    the per-frame WebSocket hot path.
+    """
+
+    frame_id: str
+    user_id: Optional[str]
+    module_id: Optional[str]
+    section_id: Optional[str]
+    timestamp: float
+    jpeg: memoryview
+    return_frame: bool = False
+
+
+def _b64_decoded_size(encoded_len: int, padding: int) -> int:
+    """Exact decoded size of unwrapped base64 text; ``=`` padding carries no data."""
+
+    return ((encoded_len * 3) >> 2) - padding
+
+
+def decode_frame(data_url: str) -> np.ndarray:
+    """Convert a browser data URL (base64-encoded) into a numpy array image."""
+
+    # Reject oversized frames from the string length alone, before paying for the
+    # base64 decode (or materializing the decoded bytes).
+    max_bytes = settings.max_frame_kb * 1024
+    if len(data_url) > ((max_bytes + 2) // 3) * 4 + 64:
+        raise HTTPException(status_code=413, detail="Frame exceeds size limit")
+
+    # Slice past the header instead of split() to avoid a second large string.
+    comma = data_url.find(",")
+    if comma < 0:
+        raise HTTPException(status_code=400, detail="Malformed data URL")
+    if _b64_decoded_size(len(data_url) - comma - 1, data_url[-2:].count("=")) > max_bytes:
+        raise HTTPException(status_code=413, detail="Frame exceeds size limit")
+    return decode_frame_bytes(base64.b64decode(data_url[comma + 1 :], validate=False))
+
+
+DATA_URL_PREFIX = b"data:image/"
+
+
+def _is_data_url(buf: memoryview) -> bool:
+    return bytes(buf[: len(DATA_URL_PREFIX)]) == DATA_URL_PREFIX
+
+
+def decode_data_url_bytes(buf: memoryview) -> bytes:
+    """Base64-decode a data URL posted as a raw body without converting it to str."""
+
+    comma = bytes(buf[:256]).find(b",")
+    if comma < 0:
+        raise HTTPException(status_code=400, detail="Malformed data URL")
+    padding = bytes(buf[-2:]).count(b"=")
+    if _b64_decoded_size(len(buf) - comma - 1, padding) > settings.max_frame_kb * 1024:
+        raise HTTPException(status_code=413, detail="Frame exceeds size limit")
+    return base64.b64decode(buf[comma + 1 :], validate=False)
+
+
+def decode_frame_bytes(raw_bytes: bytes) -> np.ndarray:
+    """Decode raw (not base64) image bytes, enforcing the frame size limit."""
+
+    max_bytes = settings.max_frame_kb * 1024
+    if len(raw_bytes) > max_bytes:
+        raise HTTPException(status_code=413, detail="Frame exceeds size limit")
+
+    return decode_image(raw_bytes)
+
+
+def decode_data(data: Union[str, bytes, memoryview]) -> np.ndarray:
+    """Decode a data URL string, or JPEG / data URL bytes, into a BGR image."""
+
+    if isinstance(data, str):
+        return decode_frame(data)
+    raw_bytes = memoryview(data)
+    if _is_data_url(raw_bytes):
+        raw_bytes = decode_data_url_bytes(raw_bytes)
+    return decode_frame_bytes(raw_bytes)
+
+
+def track_frame(
+    data: Union[str, bytes, memoryview],
+    user_id: Optional[str],
+    module_id: Optional[str],
+    section_id: Optional[str],
+    return_frame: bool,
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Decode a frame (data URL string, or JPEG / data URL bytes) and run the tracker.
+
+    The tracker copies whatever it keeps, so the decoded frame goes back to the
+    pool as soon as ``process_remote_frame`` returns.
+    """
+
+    image = decode_data(data)
+    try:
+        return browser_tracker.process_remote_frame(
+            image,
+            user_id,
+            module_id,
+            section_id,
+            return_frame=return_frame,
+        )
+    finally:
+        release_frame(image)
+
+
+def decode_and_track(
+    payload: Union[FramePayload, WSFramePayload, FrameMsg],
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Decode and run the tracker in one worker-thread hop."""
+
+    data = payload.jpeg if isinstance(payload, FrameMsg) else payload.frame_base64
+    return track_frame(
+        data, payload.user_id, payload.module_id, payload.section_id, payload.return_frame
+    )
+
+
+def _settle(future: asyncio.Future, result: Any) -> None:
+    # Sockets that went away while queued have cancelled their futures.
+    if future.done():
+        return
+    if isinstance(result, Exception):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
+
+def decode_and_track_batch(
+    batch: List[Tuple[Union[WSFramePayload, FrameMsg], asyncio.Future]],
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Decode a batch and hand it to the tracker in one call.
+
+    Each frame's future is settled on ``loop`` as soon as that frame is done, with
+    its tracker result or the exception that rejected it, so one bad frame does
+    not fail (or hold up) its neighbours.
+    """
+
+    images: List[np.ndarray] = []
+    decoded: List[Tuple[Union[WSFramePayload, FrameMsg], asyncio.Future]] = []
+    for payload, future in batch:
+        data = payload.jpeg if isinstance(payload, FrameMsg) else payload.frame_base64
+        try:
+            images.append(decode_data(data))
+        except Exception as exc:  # noqa: BLE001 - reported to that frame's socket only
+            loop.call_soon_threadsafe(_settle, future, exc)
+            continue
+        decoded.append((payload, future))
+
+    def on_result(index: int, result: Any) -> None:
+        release_frame(images[index])
+        loop.call_soon_threadsafe(_settle, decoded[index][1], result)
+
+    browser_tracker.process_remote_frames_batch(
+        images,
+        [payload.user_id for payload, _ in decoded],
+        [payload.module_id for payload, _ in decoded],
+        [payload.section_id for payload, _ in decoded],
+        return_frames=[payload.return_frame for payload, _ in decoded],
+        on_result=on_result,
+    )
+
+
+# WebSocket frames from every connection are handed to the tracker in batches of
+# up to BATCH_MAX_FRAMES: one threadpool hop per batch instead of per frame.
+# settings.batch_workers batchers drain the queue, so that many batches can be
+# on the threadpool at once.
+BATCH_MAX_FRAMES = 4
+frame_batches: Optional[asyncio.Queue] = None
+
+
+async def run_frame_batches() -> None:
+    """Drain queued WebSocket frames into batches for ``decode_and_track_batch``.
+
+    Only frames already waiting are batched, so a lone client pays no extra
+    latency; batches form while every batcher is busy on the threadpool.
+    """
+
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await frame_batches.get()]
+        while len(batch) < BATCH_MAX_FRAMES and not frame_batches.empty():
+            batch.append(frame_batches.get_nowait())
+
+        batch = [(payload, future) for payload, future in batch if not future.done()]
+        if not batch:
+            continue
+
+        try:
+            await run_in_threadpool(decode_and_track_batch, batch, loop)
+        except Exception as exc:  # noqa: BLE001 - fail what is left, keep batching
+            for _, future in batch:
+                _settle(future, exc)
+
+
+async def track_batched(
+    payload: Union[WSFramePayload, FrameMsg],
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    future = asyncio.get_running_loop().create_future()
+    frame_batches.put_nowait((payload, future))
+    return await future
+
+
+class FrameRejected(Exception):
+    """Picklable stand-in for ``HTTPException`` raised inside a tracker process."""
+
+    def __init__(self, status_code: int, detail: Any) -> None:
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _track_frame_in_process(*args: Any) -> Tuple[Dict[str, Any], Optional[str]]:
+    try:
+        return track_frame(*args)
+    except HTTPException as exc:
+        # Starlette's HTTPException does not round-trip through pickle.
+        raise FrameRejected(exc.status_code, exc.detail) from None
+
+
+async def track_in_process(
+    payload: Union[FramePayload, WSFramePayload, FrameMsg],
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Run ``track_frame`` in the user's tracker process, shipping the compressed frame.
+
+    Users are pinned to a process by ``crc32(user_id)`` (stable across worker
+    restarts, unlike ``hash``) so one session is never split across
+    EyeTrackingService instances. The JPEG (or base64 data URL)
+    crosses the process boundary rather than the decoded image, which is about
+    10x larger.
+    """
+
+    index = zlib.crc32((payload.user_id or "").encode()) % len(tracker_executors)
+    executor = tracker_executors[index]
+    data = bytes(payload.jpeg) if isinstance(payload, FrameMsg) else payload.frame_base64
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            _track_frame_in_process,
+            data,
+            payload.user_id,
+            payload.module_id,
+            payload.section_id,
+            payload.return_frame,
+        )
+    except FrameRejected as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail) from None
+    except BrokenProcessPool:
+        # The child died (e.g. a MediaPipe crash); a broken executor never recovers,
+        # so replace it unless a concurrent request already has.
+        if tracker_executors and tracker_executors[index] is executor:
+            logger.error("Tracker process %d died; restarting it", index)
+            tracker_executors[index] = _create_tracker_executor()
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise HTTPException(
+            status_code=503, detail="Tracker process restarted, please retry"
+        ) from None
+
+
+async def process_frame(
+    payload: Union[FramePayload, WSFramePayload, FrameMsg],
+    batched: bool = False,
+) -> Dict[str, Any]:
+    """Decode frame, run the shared eye-tracking pipeline, and format response.
+
+    ``batched`` frames (WebSocket) share a tracker call with other connections'
+    frames when the threadpool path is in use.
+    """
 
     if not settings.browser_streaming_enabled:
         raise HTTPException(
@@ -156,14 +624,12 @@ async def process_frame(payload: FramePayload) -> Dict[str, Any]:
     if not payload.user_id or not payload.module_id:
         raise HTTPException(status_code=400, detail="user_id and module_id are required.")
 
-    image = await run_in_threadpool(decode_frame, payload.frame_base64)
-    status, frame_data = await run_in_threadpool(
-        browser_tracker.process_remote_frame,
-        image,
-        payload.user_id,
-        payload.module_id,
-        payload.section_id,
-    )
+    if tracker_executors:
+        status, frame_data = await track_in_process(payload)
+    elif batched and frame_batches is not None:
+        status, frame_data = await track_batched(payload)
+    else:
+        status, frame_data = await run_in_threadpool(decode_and_track, payload)
 
     response = {
         "success": True,
@@ -174,67 +640,301 @@ async def process_frame(payload: FramePayload) -> Dict[str, Any]:
         "timestamp": payload.timestamp,
         "status": status,
         "metrics": status.get("metrics"),
-        "current_frame": frame_data,
     }
+    # The annotated frame is the bulk of the egress; only send it when asked for.
+    if payload.return_frame:
+        response["current_frame"] = frame_data
     return response
 
 
 @app.post("/api/frames")
 @app.post("/api/stream-frame")
-async def ingest_frame(payload: FramePayload) -> JSONResponse:
-    """HTTP endpoint hit by fetch() in the browser."""
+async def ingest_frame(payload: FramePayload, debug: bool = False) -> Dict[str, Any]:
+    """HTTP endpoint hit by fetch() in the browser.
 
+    ``?debug=1`` forces ``current_frame`` into the response for debug UIs.
+    """
+
+    if debug:
+        payload.return_frame = True
     result = await process_frame(payload)
-    return JSONResponse(content=result)
+    return result
+
+
+@app.post("/api/frames-binary")
+async def ingest_frame_binary(
+    request: Request,
+    user_id: Optional[str] = None,
+    module_id: Optional[str] = None,
+    section_id: Optional[str] = None,
+    frame_id: Optional[str] = None,
+    debug: bool = False,
+) -> Dict[str, Any]:
+    """Raw JPEG upload (``fetch(url, {method: "POST", body: blob})``).
+
+    Metadata travels in the query string; the body goes straight to the decoder
+    with no pydantic model and no base64. A ``canvas.toDataURL()`` string posted
+    as the body is also accepted and decoded as bytes.
+    """
+
+    body = await request.body()
+    frame = FrameMsg(
+        frame_id=frame_id or uuid.uuid4().hex,
+        user_id=user_id,
+        module_id=module_id,
+        section_id=section_id,
+        timestamp=time.time(),
+        jpeg=memoryview(body),
+        return_frame=debug,
+    )
+    result = await process_frame(frame)
+    return result
 
 
 class WebSocketLimiter:
-    """Simple token bucket per client to enforce FPS contracts."""
+    """Integer token bucket per client to enforce FPS contracts.
+
+    Allowance is kept in nano-tokens (1 frame = 10**9) so refilling from
+    ``time.monotonic_ns()`` is an exact integer multiply with no float math.
+    """
+
+    TOKEN = 1_000_000_000
 
     def __init__(self, max_fps: int) -> None:
         self.max_fps = max_fps
-        self.allowance = max_fps
-        self.last_check = time.monotonic()
+        self.capacity = max_fps * self.TOKEN
+        self.allowance = self.capacity
+        self.last_ns = time.monotonic_ns()
 
     def consume(self) -> bool:
-        current = time.monotonic()
-        time_passed = current - self.last_check
-        self.last_check = current
-        self.allowance += time_passed * self.max_fps
-        if self.allowance > self.max_fps:
-            self.allowance = self.max_fps
-        if self.allowance < 1.0:
+        now = time.monotonic_ns()
+        allowance = self.allowance + (now - self.last_ns) * self.max_fps
+        self.last_ns = now
+        if allowance > self.capacity:
+            allowance = self.capacity
+        if allowance < self.TOKEN:
+            self.allowance = allowance
             return False
-        self.allowance -= 1.0
+        self.allowance = allowance - self.TOKEN
         return True
 
 
-async def websocket_settings(_: Request) -> WebSocketLimiter:
-    return WebSocketLimiter(settings.max_client_fps)
+# Limiters shared by every connection for the same user (or, for anonymous
+# frames, the same client IP), so opening more sockets does not buy more FPS.
+# Behind a reverse proxy the client IP is only the real one when uvicorn trusts
+# the proxy's X-Forwarded-For (FORWARDED_ALLOW_IPS). Idle buckets expire lazily
+# (no timer task).
+LIMITER_TTL_NS = 60 * 1_000_000_000
+_limiters: Dict[str, WebSocketLimiter] = {}
+_last_sweep_ns = time.monotonic_ns()
+
+
+def get_limiter(key: str) -> WebSocketLimiter:
+    """Return the shared limiter for ``key``, expiring idle buckets on access."""
+
+    global _last_sweep_ns
+    now = time.monotonic_ns()
+    if now - _last_sweep_ns > LIMITER_TTL_NS:
+        for stale_key in [k for k, v in _limiters.items() if now - v.last_ns > LIMITER_TTL_NS]:
+            del _limiters[stale_key]
+        _last_sweep_ns = now
+
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = WebSocketLimiter(settings.max_client_fps)
+    return limiter
+
+
+def allow_frame(client_host: str, user_id: Optional[str]) -> bool:
+    """Charge one frame to the user's bucket, or to the client IP's if anonymous."""
+
+    key = "user:" + user_id if user_id else "host:" + client_host
+    return get_limiter(key).consume()
+
+
+# Binary WebSocket frame header: user_id, module_id, section_id (UTF-8, NUL-padded
+# to 16 bytes each), capture timestamp (float64 seconds) and JPEG length (uint32),
+# little-endian, followed directly by the JPEG body. Each id field must end in at
+# least one NUL, so ids are at most 15 bytes and a truncated id is detectable.
+FRAME_HEADER = struct.Struct("<16s16s16sdI")
+
+
+def _header_field(value: bytes, name: str) -> Optional[str]:
+    if value[-1:] != b"\0":
+        raise ValueError(f"{name} longer than {len(value) - 1} bytes")
+    return value.rstrip(b"\0").decode("utf-8") or None
+
+
+def unpack_binary_frame(message: bytes) -> FrameMsg:
+    """Split a binary WebSocket message into frame metadata and the raw JPEG body."""
+
+    if len(message) < FRAME_HEADER.size:
+        raise ValueError("message shorter than frame header")
+
+    user_id, module_id, section_id, timestamp, jpeg_len = FRAME_HEADER.unpack_from(message, 0)
+    jpeg = memoryview(message)[FRAME_HEADER.size :]
+    if len(jpeg) != jpeg_len:
+        raise ValueError(f"expected {jpeg_len} JPEG bytes, got {len(jpeg)}")
+
+    return FrameMsg(
+        frame_id=uuid.uuid4().hex,
+        user_id=_header_field(user_id, "user_id"),
+        module_id=_header_field(module_id, "module_id"),
+        section_id=_header_field(section_id, "section_id"),
+        timestamp=timestamp,
+        jpeg=jpeg,
+    )
+
+
+# Metric keys in the order binary clients receive them as float32 values
+# (the numeric fields of get_detailed_metrics). Bools are packed as 0/1; a key
+# that is missing or not a number is sent as NaN.
+METRIC_KEYS: Tuple[str, ...] = (
+    "focused_time",
+    "unfocused_time",
+    "total_time",
+    "focus_percentage",
+    "attention_score",
+    "is_focused",
+    "focus_sessions",
+    "unfocus_sessions",
+    "detection_rate",
+    "frames_processed",
+)
+
+
+def _metric_value(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def pack_metrics(metrics: Optional[Dict[str, Any]]) -> np.ndarray:
+    """Flatten the tracker's metrics dict into a float32 array ordered by ``METRIC_KEYS``."""
+
+    metrics = metrics or {}
+    return np.fromiter(
+        (_metric_value(metrics.get(key)) for key in METRIC_KEYS),
+        dtype=np.float32,
+        count=len(METRIC_KEYS),
+    )
+
+
+def _packb(obj: Any) -> bytes:
+    return ormsgpack.packb(obj, option=ormsgpack.OPT_SERIALIZE_NUMPY)
+
+
+def _dumps_text(obj: Any) -> str:
+    # Text frames keep browser clients on JSON.parse(event.data); orjson handles
+    # numpy scalars/arrays in status/metrics without a tolist() pass.
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+# How often (at most) a WebSocket client is told how many frames were coalesced.
+DROP_REPORT_INTERVAL_NS = 5 * 1_000_000_000
 
 
 @app.websocket("/ws/frames")
-async def websocket_frames(websocket: WebSocket, limiter: WebSocketLimiter = Depends(websocket_settings)) -> None:
-    """Optional WebSocket channel for smoother streaming."""
+async def websocket_frames(websocket: WebSocket) -> None:
+    """Optional WebSocket channel for smoother streaming.
+
+    Binary messages use ``FRAME_HEADER`` + raw JPEG and get msgpack replies; text
+    messages carry the JSON ``FramePayload`` and get JSON replies.
+
+    Frames are coalesced drop-to-latest: a reader task keeps only the newest
+    unprocessed message, so a client that outpaces the tracker sees fresh
+    results instead of a growing backlog. The number of dropped frames is
+    reported periodically as ``{"type": "dropped", "dropped": n}``.
+    """
 
     await websocket.accept()
+    client_host = websocket.client.host if websocket.client else "unknown"
+    latest: asyncio.Queue = asyncio.Queue(maxsize=1)
+    dropped = 0
+
+    async def read_latest() -> None:
+        nonlocal dropped
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if latest.full():
+                    latest.get_nowait()
+                    dropped += 1
+                latest.put_nowait(message)
+        finally:
+            # Wake the worker with a sentinel; any pending frame is moot now.
+            if latest.full():
+                latest.get_nowait()
+            latest.put_nowait(None)
+
+    reader = asyncio.create_task(read_latest())
+    sent_metric_keys = False
+    reported = 0
+    last_report_ns = time.monotonic_ns()
     try:
         while True:
-            message = await websocket.receive_text()
-            try:
-                payload = FramePayload(**json.loads(message))
-            except Exception as exc:  # noqa: BLE001
-                await websocket.send_json({"error": f"Invalid payload: {exc}"})
-                continue
-
-            if not limiter.consume():
-                await websocket.send_json({"error": "Rate limit exceeded"})
-                continue
-
-            result = await process_frame(payload)
-            await websocket.send_json(result)
+            message = await latest.get()
+            if message is None:
+                raise WebSocketDisconnect(1000)
+
+            binary = message.get("bytes") is not None
+            if binary:
+                try:
+                    frame = unpack_binary_frame(message["bytes"])
+                except ValueError as exc:
+                    await websocket.send_bytes(_packb({"error": f"Invalid frame: {exc}"}))
+                    continue
+
+                if not allow_frame(client_host, frame.user_id):
+                    await websocket.send_bytes(_packb({"error": "Rate limit exceeded"}))
+                    continue
+
+                try:
+                    result = await process_frame(frame, batched=True)
+                except HTTPException as exc:
+                    await websocket.send_bytes(_packb({"error": exc.detail}))
+                    continue
+                # One float32 vector instead of a nested dict of Python floats;
+                # the key order goes out once per connection.
+                result["metrics"] = pack_metrics(result["status"].pop("metrics", None))
+                if not sent_metric_keys:
+                    result["metric_keys"] = METRIC_KEYS
+                    sent_metric_keys = True
+                await websocket.send_bytes(_packb(result))
+            else:
+                try:
+                    payload = _ws_frame_decoder.decode(message["text"])
+                except Exception as exc:  # noqa: BLE001
+                    await websocket.send_text(_dumps_text({"error": f"Invalid payload: {exc}"}))
+                    continue
+
+                if not allow_frame(client_host, payload.user_id):
+                    await websocket.send_text(_dumps_text({"error": "Rate limit exceeded"}))
+                    continue
+
+                try:
+                    result = await process_frame(payload, batched=True)
+                except HTTPException as exc:
+                    await websocket.send_text(_dumps_text({"error": exc.detail}))
+                    continue
+                await websocket.send_text(_dumps_text(result))
+
+            now = time.monotonic_ns()
+            if dropped != reported and now - last_report_ns >= DROP_REPORT_INTERVAL_NS:
+                report = {"type": "dropped", "dropped": dropped}
+                if binary:
+                    await websocket.send_bytes(_packb(report))
+                else:
+                    await websocket.send_text(_dumps_text(report))
+                reported = dropped
+                last_report_ns = now
     except WebSocketDisconnect:
-        logger.info("WebSocket disconnected")
+        logger.info("WebSocket disconnected (%d frames coalesced)", dropped)
+    finally:
+        reader.cancel()
 
 
 @app.get("/healthz")
@@ -252,5 +952,29 @@ async def health() -> Dict[str, Any]:
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("web_stream_service:app", host="0.0.0.0", port=8000, reload=True)
+    # Each worker process gets its own stateful EyeTrackingService, so only raise
+    # this when clients are pinned to a worker (sticky sessions)
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
 
+    # uvloop/httptools/websockets ship with uvicorn[standard]; uvloop is unavailable on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "asyncio", "h11"
+    try:
+        import websockets  # noqa: F401
+        ws = "websockets"
+    except ImportError:
+        ws = "auto"
+
+    uvicorn.run(
+        "web_stream_service:app",
+        host="0.0.0.0",
+        port=8000,
+        loop=loop,
+        http=http,
+        ws=ws,
+        workers=workers,
+        reload=False,
+    )